@@ -7,6 +7,7 @@ Usage:
     python archive_session.py -c cookies.json
     python archive_session.py -c cookies.txt --list-keys
     python archive_session.py -c cookies.txt --list-zones
+    python archive_session.py -c cookies.txt --list-zones --cache-dir .cache
     python archive_session.py -c cookies.txt --es-worksheet
     python archive_session.py -c cookies.txt --list-keys --start-date 01/01/2024 --end-date 12/31/2024
     python archive_session.py -c cookies.txt --list-zones --download
@@ -16,18 +17,79 @@ Usage:
 """
 
 import argparse
+import codecs
+import hashlib
+import html
 import http.cookiejar
 import json
+import multiprocessing
 import os
 import re
+import shutil
 import sys
+import tempfile
+import threading
+import time
 import zipfile
+import zlib
+from bisect import bisect_right
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse, urljoin, parse_qs, unquote
 
-import requests
-from bs4 import BeautifulSoup
+import lxml.etree
+import lxml.html
+import httpx
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is optional; fall back to lxml
+    LexborHTMLParser = None
+
+# Worker threads used for concurrent page fetches and downloads
+MAX_WORKERS = 10
+
+# Upper bound on requests in flight against any single host, shared by
+# every worker pool so the site is never hit harder than this
+MAX_CONNECTIONS_PER_HOST = 5
+
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_host_slots_lock = threading.Lock()
+
+# Serializes output from worker threads so their lines don't interleave
+_print_lock = threading.Lock()
+
+# Seconds before a cached Keys page is fetched again
+CACHE_MAX_AGE = 24 * 60 * 60
+
+# Buffer size used when streaming downloads and zip members to disk
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Matches dates in MM/DD/YYYY format
+_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
+
+# Anchor tags with an href, and any tag, for the --list-keys fast path
+_ANCHOR_RE = re.compile(
+    rb'(?i:<a\b)[^>]*?\s(?i:href)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))[^>]*>(.*?)(?i:</a\s*>)',
+    re.S
+)
+_TAG_RE = re.compile(r'<[^>]*>')
+# Comments and script/style blocks, whose anchors a parser never sees
+_HIDDEN_RE = re.compile(rb'<!--.*?-->|<(script|style)\b.*?</\1\s*>', re.S | re.I)
+# <meta charset=...> or <meta http-equiv=... content="...; charset=...">
+_META_CHARSET_RE = re.compile(rb'<meta\b[^>]*?charset\s*=\s*["\']?\s*([\w.:-]+)', re.I)
+
+# Matches non-comment "name=value" lines in a plain cookie file
+_COOKIE_LINE_RE = re.compile(rb'^[ \t]*([^#=\s][^=\n]*)=(.*?)\s*$', re.M)
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Upgrade-Insecure-Requests': '1',
+}
 
 
 def load_netscape_cookies(cookie_file: Path) -> http.cookiejar.MozillaCookieJar:
@@ -72,15 +134,12 @@ def load_cookies(cookie_file: Path) -> dict:
             jar = load_netscape_cookies(cookie_file)
             return {cookie.name: cookie.value for cookie in jar}
         except Exception as e:
-            # Fallback: try simple key=value format
-            cookies = {}
-            with open(cookie_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        cookies[key.strip()] = value.strip()
-            return cookies
+            # Fallback: try simple key=value format, scanning the whole file at once
+            data = cookie_file.read_bytes()
+            return {
+                match.group(1).strip().decode(): match.group(2).strip().decode()
+                for match in _COOKIE_LINE_RE.finditer(data)
+            }
     else:
         # Try JSON first, then Netscape
         try:
@@ -90,103 +149,206 @@ def load_cookies(cookie_file: Path) -> dict:
             return {cookie.name: cookie.value for cookie in jar}
 
 
-def fetch_archive_page(url: str, cookies: dict, timeout: int = 30) -> requests.Response:
-    """Fetch the archive page with the provided cookies."""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-    }
+def build_session(cookies: dict) -> httpx.Client:
+    """Create a client shared by every request to the archive site.
+
+    The client negotiates HTTP/2 where the server offers it, so the archive
+    page, Keys pages and file downloads are multiplexed over one TLS
+    connection; otherwise it keeps HTTP/1.1 connections alive in its pool.
+    httpx sets Accept-Encoding itself from the decoders that are installed.
+    """
+    return httpx.Client(
+        http2=True,
+        cookies=cookies,
+        headers=HEADERS,
+        timeout=30,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=32),
+    )
+
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    """Return the semaphore limiting concurrent requests to the URL's host."""
+    host = urlparse(url).netloc
+    with _host_slots_lock:
+        if host not in _host_slots:
+            _host_slots[host] = threading.BoundedSemaphore(MAX_CONNECTIONS_PER_HOST)
+        return _host_slots[host]
 
-    session = requests.Session()
-    session.cookies.update(cookies)
 
-    response = session.get(url, headers=headers, timeout=timeout)
+def _log(message: str) -> None:
+    """Print a line of progress output; safe to call from worker threads."""
+    with _print_lock:
+        print(message, flush=True)
+
+
+def fetch_archive_page(url: str, session: httpx.Client, timeout: int = 30) -> httpx.Response:
+    """Fetch the archive page using the shared session."""
+    with _host_slot(url):
+        response = session.get(url, timeout=timeout)
     return response
 
 
-def extract_key_urls(html_content: str, base_url: str) -> list[dict]:
+def _as_utf8(html_content: bytes, encoding: str | None = None) -> bytes:
+    """Return page bytes re-encoded as UTF-8 if they are in another charset.
+
+    The charset is taken from ``encoding`` (the Content-Type header), then
+    from a <meta> tag near the top of the page, and defaults to UTF-8.
+    """
+    match = _META_CHARSET_RE.search(html_content, 0, 4096)
+    for name in (encoding, match and match.group(1).decode('ascii')):
+        if not name:
+            continue
+        try:
+            codec = codecs.lookup(name).name
+        except LookupError:
+            continue
+        if codec == 'utf-8':
+            return html_content
+        return html_content.decode(codec, errors='replace').encode('utf-8')
+    return html_content
+
+
+def _extract_anchor_links(
+    html_content: bytes | str,
+    base_url: str,
+    needle: str,
+    encoding: str | None = None
+) -> list[dict]:
+    """Extract URLs from anchor tags whose text contains ``needle``.
+
+    Uses selectolax's Lexbor parser when it is installed, otherwise lxml
+    with the text filter run as an XPath expression inside libxml2. Raw
+    bytes in another charset are converted to UTF-8 first (see _as_utf8),
+    since both parsers are then told to read them as UTF-8.
+    """
+    links = []
+
+    if isinstance(html_content, bytes):
+        html_content = _as_utf8(html_content, encoding)
+
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html_content)
+        for anchor in tree.css('a[href]'):
+            text = anchor.text(strip=True)
+            if needle in text:
+                # Resolve relative URLs
+                full_url = urljoin(base_url, anchor.attributes.get('href') or '')
+                links.append({
+                    'url': full_url,
+                    'text': text
+                })
+        return links
+
+    # Parsers are not thread-safe, so build one per call; Lexbor treats
+    # bytes as UTF-8 and lxml must agree, whatever <meta> claims
+    parser = lxml.html.HTMLParser(encoding='utf-8') if isinstance(html_content, bytes) else None
+    try:
+        tree = lxml.html.fromstring(html_content, parser=parser)
+    except lxml.etree.ParserError:
+        # Empty documents, or ones holding only a comment or XML declaration
+        return links
+
+    for anchor in tree.xpath('//a[@href][contains(., $needle)]', needle=needle):
+        # Match BeautifulSoup's get_text(strip=True)
+        text = ''.join(part.strip() for part in anchor.itertext())
+        # XPath matched the unstripped text; re-check the stripped form
+        if needle in text:
+            # Resolve relative URLs
+            full_url = urljoin(base_url, anchor.get('href'))
+            links.append({
+                'url': full_url,
+                'text': text
+            })
+
+    return links
+
+
+def extract_key_urls(html_content: bytes | str, base_url: str, encoding: str | None = None) -> list[dict]:
     """Extract all URLs from anchor tags that contain 'Key' in their text.
 
     Args:
-        html_content: The HTML content to parse
+        html_content: The HTML content to parse, as bytes or text
         base_url: The base URL for resolving relative links
+        encoding: Charset from the Content-Type header, if known
+
+    Returns:
+        List of dicts with 'url' and 'text' keys
+    """
+    return _extract_anchor_links(html_content, base_url, 'Key', encoding)
+
+
+def scan_key_urls(html_content: bytes, base_url: str, encoding: str | None = None) -> list[dict]:
+    """Find anchors containing 'Key' with a regex scan instead of a parser.
+
+    This is the fast path for --list-keys. Anchor text is built the same way
+    as in extract_key_urls, and comments and script/style blocks are
+    removed first so their anchors are ignored as a parser would. Markup
+    the regex does not expect (nested anchors, 'Key' split across tags) is
+    not seen, so callers should fall back to extract_key_urls when nothing
+    is found.
+
+    Args:
+        html_content: The raw HTML bytes to scan
+        base_url: The base URL for resolving relative links
+        encoding: Charset from the Content-Type header, if known
 
     Returns:
         List of dicts with 'url' and 'text' keys
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
     key_links = []
+    html_content = _as_utf8(html_content, encoding)
+
+    # Leave an empty comment behind so text on either side still splits
+    # into separate text nodes
+    for match in _ANCHOR_RE.finditer(_HIDDEN_RE.sub(b'<!---->', html_content)):
+        inner = match.group(4)
+        if b'Key' not in inner:
+            continue
 
-    for anchor in soup.find_all('a', href=True):
-        text = anchor.get_text(strip=True)
+        # Match BeautifulSoup's get_text(strip=True)
+        text = ''.join(
+            html.unescape(part).strip()
+            for part in _TAG_RE.split(inner.decode('utf-8', errors='replace'))
+        )
         if 'Key' in text:
-            href = anchor['href']
+            href = match.group(1) or match.group(2) or match.group(3) or b''
+            href = html.unescape(href.decode('utf-8', errors='replace'))
             # Resolve relative URLs
-            full_url = urljoin(base_url, href)
             key_links.append({
-                'url': full_url,
+                'url': urljoin(base_url, href),
                 'text': text
             })
 
     return key_links
 
 
-def extract_zone_urls(html_content: str, base_url: str) -> list[dict]:
+def extract_zone_urls(html_content: bytes | str, base_url: str, encoding: str | None = None) -> list[dict]:
     """Extract all URLs from anchor tags that contain 'Zones' in their text.
 
     Args:
-        html_content: The HTML content to parse
+        html_content: The HTML content to parse, as bytes or text
         base_url: The base URL for resolving relative links
+        encoding: Charset from the Content-Type header, if known
 
     Returns:
         List of dicts with 'url' and 'text' keys
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    zone_links = []
+    return _extract_anchor_links(html_content, base_url, 'Zones File', encoding)
 
-    for anchor in soup.find_all('a', href=True):
-        text = anchor.get_text(strip=True)
-        if 'Zones File' in text:
-            href = anchor['href']
-            # Resolve relative URLs
-            full_url = urljoin(base_url, href)
-            zone_links.append({
-                'url': full_url,
-                'text': text
-            })
-
-    return zone_links
 
-
-def extract_worksheet_urls(html_content: str, base_url: str) -> list[dict]:
+def extract_worksheet_urls(html_content: bytes | str, base_url: str, encoding: str | None = None) -> list[dict]:
     """Extract all URLs from anchor tags that contain 'Trader Worksheet' in their text.
 
     Args:
-        html_content: The HTML content to parse
+        html_content: The HTML content to parse, as bytes or text
         base_url: The base URL for resolving relative links
+        encoding: Charset from the Content-Type header, if known
 
     Returns:
         List of dicts with 'url' and 'text' keys
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    worksheet_links = []
-
-    for anchor in soup.find_all('a', href=True):
-        text = anchor.get_text(strip=True)
-        if 'Trader Worksheet' in text:
-            href = anchor['href']
-            # Resolve relative URLs
-            full_url = urljoin(base_url, href)
-            worksheet_links.append({
-                'url': full_url,
-                'text': text
-            })
-
-    return worksheet_links
+    return _extract_anchor_links(html_content, base_url, 'Trader Worksheet', encoding)
 
 
 def parse_date_from_text(text: str) -> datetime | None:
@@ -198,8 +360,7 @@ def parse_date_from_text(text: str) -> datetime | None:
     Returns:
         datetime object if a date is found, None otherwise
     """
-    # Match MM/DD/YYYY format
-    match = re.search(r'(\d{1,2})/(\d{1,2})/(\d{4})', text)
+    match = _DATE_RE.search(text)
     if match:
         try:
             month, day, year = match.groups()
@@ -227,11 +388,29 @@ def filter_keys_by_date(
     if start_date is None and end_date is None:
         return key_urls
 
-    filtered = []
+    # Scan all texts in one regex pass, using a separator that cannot be
+    # part of a date, and map each match back to its item by offset
+    offsets = []
+    position = 0
     for item in key_urls:
-        item_date = parse_date_from_text(item['text'])
-        if item_date is None:
-            # If we can't parse a date, skip this item when filtering
+        offsets.append(position)
+        position += len(item['text']) + 1
+    joined = '\x1e'.join(item['text'] for item in key_urls)
+
+    filtered = []
+    last_index = -1
+    for match in _DATE_RE.finditer(joined):
+        index = bisect_right(offsets, match.start()) - 1
+        if index == last_index:
+            # Only the first date in each text counts, as in parse_date_from_text
+            continue
+        last_index = index
+
+        # Items without a parseable date are skipped when filtering
+        try:
+            month, day, year = match.groups()
+            item_date = datetime(int(year), int(month), int(day))
+        except ValueError:
             continue
 
         if start_date and item_date < start_date:
@@ -239,69 +418,159 @@ def filter_keys_by_date(
         if end_date and item_date > end_date:
             continue
 
-        filtered.append(item)
+        filtered.append(key_urls[index])
 
     return filtered
 
 
-def fetch_zones_from_keys(keys_urls: list[dict], cookies: dict, verbose: bool = False) -> list[dict]:
-    """Navigate to each Keys URL and extract Zones links.
+def fetch_keys_page(
+    url: str,
+    session: httpx.Client,
+    cache_dir: Path | None = None,
+    verbose: bool = False
+) -> tuple[bytes, str | None] | None:
+    """Fetch a Keys page, reusing a cached copy from ``cache_dir`` if present.
+
+    Cached copies older than CACHE_MAX_AGE seconds are refetched. Responses
+    that arrived through a redirect (e.g. to a login page after the cookies
+    expired) are never cached. Pages are cached as UTF-8, since the
+    Content-Type header that named their charset is not kept.
 
     Args:
-        keys_urls: List of dicts with 'url' and 'text' keys from extract_key_urls
-        cookies: Session cookies for authentication
+        url: The Keys page URL
+        session: Shared session from build_session
+        cache_dir: Optional directory for cached pages, keyed by URL hash
         verbose: Whether to print verbose output
 
     Returns:
-        List of dicts with 'key_url', 'key_text', 'zone_url', and 'zone_text' keys
+        Tuple of (page bytes, charset from the Content-Type header or
+        'utf-8' for a cached copy), or None if the server did not return
+        status 200
     """
-    all_zones = []
+    cached = None
+    if cache_dir is not None:
+        cached = cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.html"
+        if cached.exists() and time.time() - cached.stat().st_mtime < CACHE_MAX_AGE:
+            if verbose:
+                _log(f"  Using cached copy of {url}")
+            return cached.read_bytes(), 'utf-8'
 
-    for key_item in keys_urls:
-        key_url = key_item['url']
-        key_text = key_item['text']
+    response = fetch_archive_page(url, session)
+    if response.status_code != 200:
+        _log(f"  Warning: Got status {response.status_code} for {url}")
+        return None
 
-        if verbose:
-            print(f"\nFetching Keys page: {key_text}")
-            print(f"  URL: {key_url}")
+    if cached is not None and not response.history:
+        # Write to a unique temp file then rename, so an interrupted run never
+        # leaves a partial page and threads fetching the same URL don't collide
+        with tempfile.NamedTemporaryFile(dir=cache_dir, suffix='.part', delete=False) as partial:
+            partial.write(_as_utf8(response.content, response.charset_encoding))
+        Path(partial.name).replace(cached)
 
-        try:
-            response = fetch_archive_page(key_url, cookies)
-            if response.status_code != 200:
-                print(f"  Warning: Got status {response.status_code} for {key_url}")
-                continue
+    return response.content, response.charset_encoding
 
-            zone_links = extract_zone_urls(response.text, key_url)
 
-            for zone in zone_links:
-                all_zones.append({
-                    'key_url': key_url,
-                    'key_text': key_text,
-                    'zone_url': zone['url'],
-                    'zone_text': zone['text']
-                })
+def _fetch_zones_for_key(
+    key_item: dict,
+    session: httpx.Client,
+    cache_dir: Path | None = None,
+    verbose: bool = False
+) -> list[dict]:
+    """Fetch a single Keys page and return its Zones links."""
+    key_url = key_item['url']
+    key_text = key_item['text']
 
-            if verbose:
-                print(f"  Found {len(zone_links)} Zones link(s)")
+    if verbose:
+        _log(f"\nFetching Keys page: {key_text}\n  URL: {key_url}")
 
-        except requests.RequestException as e:
-            print(f"  Error fetching {key_url}: {e}")
-            continue
+    try:
+        page = fetch_keys_page(key_url, session, cache_dir, verbose)
+        if page is None:
+            return []
+
+        html_content, encoding = page
+        zone_links = extract_zone_urls(html_content, key_url, encoding)
+
+    except httpx.HTTPError as e:
+        _log(f"  Error fetching {key_url}: {e}")
+        return []
+
+    if verbose:
+        _log(f"  Found {len(zone_links)} Zones link(s) on {key_text}")
+
+    return [
+        {
+            'key_url': key_url,
+            'key_text': key_text,
+            'zone_url': zone['url'],
+            'zone_text': zone['text']
+        }
+        for zone in zone_links
+    ]
+
+
+def fetch_zones_from_keys(
+    keys_urls: list[dict],
+    session: httpx.Client,
+    verbose: bool = False,
+    max_workers: int = MAX_WORKERS,
+    cache_dir: Path | None = None
+) -> list[dict]:
+    """Navigate to each Keys URL and extract Zones links.
+
+    Keys pages are fetched concurrently; results are returned in the same
+    order as ``keys_urls``.
+
+    Args:
+        keys_urls: List of dicts with 'url' and 'text' keys from extract_key_urls
+        session: Shared session from build_session
+        verbose: Whether to print verbose output
+        max_workers: Maximum number of Keys pages fetched at once
+        cache_dir: Optional directory for caching Keys pages between runs
+
+    Returns:
+        List of dicts with 'key_url', 'key_text', 'zone_url', and 'zone_text' keys
+    """
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    results = [[] for _ in keys_urls]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_fetch_zones_for_key, key_item, session, cache_dir, verbose): index
+            for index, key_item in enumerate(keys_urls)
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    all_zones = []
+    for zones in results:
+        all_zones.extend(zones)
 
     return all_zones
 
 
-def fetch_worksheets_from_keys(keys_urls: list[dict], cookies: dict, verbose: bool = False) -> list[dict]:
+def fetch_worksheets_from_keys(
+    keys_urls: list[dict],
+    session: httpx.Client,
+    verbose: bool = False,
+    cache_dir: Path | None = None
+) -> list[dict]:
     """Navigate to each Keys URL and extract Trader Worksheet links.
 
     Args:
         keys_urls: List of dicts with 'url' and 'text' keys from extract_key_urls
-        cookies: Session cookies for authentication
+        session: Shared session from build_session
         verbose: Whether to print verbose output
+        cache_dir: Optional directory for caching Keys pages between runs
 
     Returns:
         List of dicts with 'key_url', 'key_text', 'worksheet_url', and 'worksheet_text' keys
     """
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
     all_worksheets = []
 
     for key_item in keys_urls:
@@ -313,12 +582,12 @@ def fetch_worksheets_from_keys(keys_urls: list[dict], cookies: dict, verbose: bo
             print(f"  URL: {key_url}")
 
         try:
-            response = fetch_archive_page(key_url, cookies)
-            if response.status_code != 200:
-                print(f"  Warning: Got status {response.status_code} for {key_url}")
+            page = fetch_keys_page(key_url, session, cache_dir, verbose)
+            if page is None:
                 continue
 
-            worksheet_links = extract_worksheet_urls(response.text, key_url)
+            html_content, encoding = page
+            worksheet_links = extract_worksheet_urls(html_content, key_url, encoding)
 
             for worksheet in worksheet_links:
                 all_worksheets.append({
@@ -331,46 +600,136 @@ def fetch_worksheets_from_keys(keys_urls: list[dict], cookies: dict, verbose: bo
             if verbose:
                 print(f"  Found {len(worksheet_links)} Trader Worksheet link(s)")
 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"  Error fetching {key_url}: {e}")
             continue
 
     return all_worksheets
 
 
+def _sidecar_path(filepath: Path) -> Path:
+    """Return the sidecar file recording where a downloaded file came from."""
+    return filepath.with_suffix('.download.json')
+
+
+def _read_sidecar(filepath: Path) -> dict:
+    """Load the source URL and ETag stored next to a downloaded file."""
+    try:
+        return json.loads(_sidecar_path(filepath).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def _is_up_to_date(filepath: Path, url: str, head: httpx.Response) -> bool:
+    """Check whether a local file was downloaded from ``url`` and matches
+    the server's HEAD response."""
+    if not filepath.exists() or head.status_code != 200:
+        return False
+
+    sidecar = _read_sidecar(filepath)
+    if sidecar.get('url') != url:
+        return False
+
+    remote_size = int(head.headers.get('Content-Length', 0) or 0)
+    if not remote_size or filepath.stat().st_size != remote_size:
+        return False
+
+    etag = head.headers.get('ETag')
+    if etag and sidecar.get('etag'):
+        return sidecar['etag'] == etag
+
+    return True
+
+
+def _download_zone(
+    zone: dict,
+    filepath: Path,
+    session: httpx.Client,
+    headers: dict,
+    verbose: bool = False
+) -> Path | None:
+    """Download a single zone file to ``filepath``.
+
+    When the file already exists, a HEAD request is sent first and the
+    download is skipped if the file came from the same URL and matches the
+    size (and ETag, if known) reported by the server.
+    """
+    zone_url = zone['zone_url']
+    zone_text = zone.get('zone_text', '')
+
+    try:
+        if filepath.exists():
+            with _host_slot(zone_url):
+                head = session.head(zone_url, headers=headers, timeout=10)
+            if _is_up_to_date(filepath, zone_url, head):
+                if verbose:
+                    _log(f"\nSkipping: {zone_text}\n  Already downloaded: {filepath}")
+                return filepath
+
+        if verbose:
+            _log(f"\nDownloading: {zone_text}\n  URL: {zone_url}\n  To: {filepath}")
+
+        # Hold the host slot until the streamed body has been written
+        with _host_slot(zone_url):
+            with session.stream('GET', zone_url, headers=headers, timeout=60) as response:
+                response.raise_for_status()
+
+                with open(filepath, 'wb') as f:
+                    for chunk in response.iter_bytes(chunk_size=COPY_BUFFER_SIZE):
+                        f.write(chunk)
+
+        _sidecar_path(filepath).write_text(
+            json.dumps({'url': zone_url, 'etag': response.headers.get('ETag')}),
+            encoding='utf-8'
+        )
+
+        if verbose:
+            _log(f"  Downloaded: {filepath.stat().st_size} bytes ({filepath.name})")
+        return filepath
+
+    except httpx.HTTPError as e:
+        _log(f"  Error downloading {zone_url}: {e}")
+        return None
+
+
 def download_zone_files(
     zones: list[dict],
-    cookies: dict,
+    session: httpx.Client,
     download_dir: Path,
-    verbose: bool = False
+    verbose: bool = False,
+    max_workers: int = MAX_WORKERS,
+    on_downloaded: Callable[[Path], None] | None = None
 ) -> list[Path]:
     """Download zone files from URLs to the specified directory.
 
+    Target filenames are chosen up front, then files are downloaded
+    concurrently. A file downloaded from the same URL by an earlier run is
+    kept if it still matches the server, instead of being downloaded again.
+
     Args:
         zones: List of dicts with 'zone_url' and 'zone_text' keys
-        cookies: Session cookies for authentication
+        session: Shared session from build_session
         download_dir: Directory to save downloaded files
         verbose: Whether to print verbose output
+        max_workers: Maximum number of files downloaded at once
+        on_downloaded: Optional callback invoked with each file's Path as
+            soon as that file is available
 
     Returns:
         List of Paths to successfully downloaded files
     """
-    downloaded_files = []
-
     # Create download directory if it doesn't exist
     download_dir.mkdir(parents=True, exist_ok=True)
 
     headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Accept': 'application/zip,application/octet-stream,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
     }
 
-    session = requests.Session()
-    session.cookies.update(cookies)
-
+    # Pick every filename before dispatching so workers never race on them.
+    # An existing file is only reused when it was downloaded from the same
+    # URL; anything else gets a new suffixed name.
+    filepaths = []
+    claimed = set()
     for zone in zones:
         zone_url = zone['zone_url']
         zone_text = zone.get('zone_text', '')
@@ -388,38 +747,35 @@ def download_zone_files(
         # Handle duplicate filenames
         counter = 1
         original_filepath = filepath
-        while filepath.exists():
+        while filepath in claimed or (
+            filepath.exists() and _read_sidecar(filepath).get('url') != zone_url
+        ):
             stem = original_filepath.stem
             filepath = download_dir / f"{stem}_{counter}.zip"
             counter += 1
 
-        if verbose:
-            print(f"\nDownloading: {zone_text}")
-            print(f"  URL: {zone_url}")
-            print(f"  To: {filepath}")
+        claimed.add(filepath)
+        filepaths.append(filepath)
 
-        try:
-            response = session.get(zone_url, headers=headers, timeout=60, stream=True)
-            response.raise_for_status()
+    results = [None] * len(zones)
 
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_download_zone, zone, filepath, session, headers, verbose): index
+            for index, (zone, filepath) in enumerate(zip(zones, filepaths))
+        }
+        for future in as_completed(futures):
+            filepath = future.result()
+            results[futures[future]] = filepath
+            if filepath is not None and on_downloaded is not None:
+                on_downloaded(filepath)
 
-            downloaded_files.append(filepath)
-            if verbose:
-                print(f"  Downloaded: {filepath.stat().st_size} bytes")
-
-        except requests.RequestException as e:
-            print(f"  Error downloading {zone_url}: {e}")
-            continue
-
-    return downloaded_files
+    return [filepath for filepath in results if filepath is not None]
 
 
 def download_worksheet_files(
     worksheets: list[dict],
-    cookies: dict,
+    session: httpx.Client,
     download_dir: Path,
     verbose: bool = False
 ) -> list[Path]:
@@ -427,7 +783,7 @@ def download_worksheet_files(
 
     Args:
         worksheets: List of dicts with 'worksheet_url' and 'worksheet_text' keys
-        cookies: Session cookies for authentication
+        session: Shared session from build_session
         download_dir: Directory to save downloaded files
         verbose: Whether to print verbose output
 
@@ -440,16 +796,9 @@ def download_worksheet_files(
     download_dir.mkdir(parents=True, exist_ok=True)
 
     headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
     }
 
-    session = requests.Session()
-    session.cookies.update(cookies)
-
     for worksheet in worksheets:
         worksheet_url = worksheet['worksheet_url']
         worksheet_text = worksheet.get('worksheet_text', '')
@@ -488,61 +837,152 @@ def download_worksheet_files(
             print(f"  To: {filepath}")
 
         try:
-            response = session.get(worksheet_url, headers=headers, timeout=60, stream=True)
-            response.raise_for_status()
+            with session.stream('GET', worksheet_url, headers=headers, timeout=60) as response:
+                response.raise_for_status()
 
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                with open(filepath, 'wb') as f:
+                    for chunk in response.iter_bytes(chunk_size=COPY_BUFFER_SIZE):
+                        f.write(chunk)
 
             downloaded_files.append(filepath)
             if verbose:
                 print(f"  Downloaded: {filepath.stat().st_size} bytes")
 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"  Error downloading {worksheet_url}: {e}")
             continue
 
     return downloaded_files
 
 
-def extract_zip_files(
-    zip_files: list[Path],
-    extract_dir: Path,
-    verbose: bool = False
-) -> list[Path]:
-    """Extract zip files to the specified directory.
+def _file_crc32(path: Path) -> int:
+    """Compute the CRC-32 of a file, matching ZipInfo.CRC."""
+    crc = 0
+    with open(path, 'rb') as f:
+        while chunk := f.read(COPY_BUFFER_SIZE):
+            crc = zlib.crc32(chunk, crc)
+    return crc
 
-    Args:
-        zip_files: List of Paths to zip files
-        extract_dir: Directory to extract files to
-        verbose: Whether to print verbose output
+
+def _copy_member(zf: zipfile.ZipFile, info: zipfile.ZipInfo, target: Path) -> Path:
+    """Stream one member into a new temp file beside ``target`` and return it."""
+    fd, name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix='.part')
+    partial = Path(name)
+    try:
+        with open(fd, 'wb') as dst, zf.open(info) as src:
+            shutil.copyfileobj(src, dst, length=COPY_BUFFER_SIZE)
+    except BaseException:
+        # Bad CRC, truncated archive, full disk, ...
+        partial.unlink(missing_ok=True)
+        raise
+    return partial
+
+
+def _extract_one(zip_path: Path, extract_dir: Path) -> list[tuple[int, Path, int, Path | None]]:
+    """Decompress a single zip file into temp files beside their targets.
+
+    Members are streamed to disk through a fixed-size buffer rather than
+    read whole, and any member that would land outside ``extract_dir`` is
+    rejected. Members whose target already has the same size and CRC-32
+    are not decompressed. Nothing is moved into place here; see
+    _commit_extraction.
 
     Returns:
-        List of Paths to extracted directories/files
+        One (member index, target, CRC-32, temp file) tuple per file
+        member, with temp file None when the target was already up to date
     """
-    extracted = []
+    root = extract_dir.resolve()
+    members = []
 
-    for zip_path in zip_files:
-        if not zip_path.exists():
-            print(f"  Warning: File not found: {zip_path}")
-            continue
+    try:
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            for index, info in enumerate(zf.infolist()):
+                target = (root / info.filename).resolve()
+                if not target.is_relative_to(root) or target == root:
+                    raise ValueError(f"Unsafe path in archive: {info.filename}")
+
+                if info.is_dir():
+                    target.mkdir(parents=True, exist_ok=True)
+                    continue
+
+                if (
+                    target.exists()
+                    and target.stat().st_size == info.file_size
+                    and _file_crc32(target) == info.CRC
+                ):
+                    members.append((index, target, info.CRC, None))
+                    continue
+
+                target.parent.mkdir(parents=True, exist_ok=True)
+                members.append((index, target, info.CRC, _copy_member(zf, info, target)))
+    except BaseException:
+        _discard_partials(members)
+        raise
+
+    return members
+
+
+def _discard_partials(members: list[tuple[int, Path, int, Path | None]]) -> None:
+    """Remove the temp files of members that were never moved into place."""
+    for _, _, _, partial in members:
+        if partial is not None:
+            partial.unlink(missing_ok=True)
+
+
+def _commit_extraction(
+    zip_path: Path,
+    members: list[tuple[int, Path, int, Path | None]],
+    written: dict[Path, int]
+) -> tuple[int, int]:
+    """Move one archive's decompressed members into place.
+
+    Archives are committed in download order, so when several contain the
+    same member name the one listed last wins, however the workers were
+    scheduled. ``written`` maps each target replaced earlier in this run to
+    the CRC-32 it now holds; a member skipped as up to date is extracted
+    again if an earlier archive has since replaced it with other content.
 
-        if verbose:
-            print(f"\nExtracting: {zip_path}")
+    Returns:
+        Tuple of (files written, files skipped)
+    """
+    file_count = 0
+    skipped_count = 0
 
+    for position, (index, target, crc, partial) in enumerate(members):
         try:
-            with zipfile.ZipFile(zip_path, 'r') as zf:
-                # Extract directly to the extract directory
-                extract_dir.mkdir(parents=True, exist_ok=True)
-
-                zf.extractall(extract_dir)
-                extracted.append(extract_dir)
+            if partial is None:
+                if written.get(target, crc) == crc:
+                    skipped_count += 1
+                    continue
+                with zipfile.ZipFile(zip_path, 'r') as zf:
+                    partial = _copy_member(zf, zf.infolist()[index], target)
+            partial.replace(target)
+        except BaseException:
+            if partial is not None:
+                partial.unlink(missing_ok=True)
+            _discard_partials(members[position + 1:])
+            raise
+        written[target] = crc
+        file_count += 1
+
+    return file_count, skipped_count
+
+
+def _collect_extractions(
+    jobs: list[tuple[Path, Future]],
+    extract_dir: Path,
+    verbose: bool = False
+) -> list[Path]:
+    """Wait for extraction futures and move their output into place in order."""
+    extracted = []
+    written = {}
 
-                if verbose:
-                    file_count = len(zf.namelist())
-                    print(f"  Extracted {file_count} file(s) to: {extract_dir}")
+    for zip_path, future in jobs:
+        if verbose:
+            print(f"\nExtracting: {zip_path}")
 
+        try:
+            file_count, skipped_count = _commit_extraction(zip_path, future.result(), written)
         except zipfile.BadZipFile:
             print(f"  Error: Invalid zip file: {zip_path}")
             continue
@@ -550,9 +990,58 @@ def extract_zip_files(
             print(f"  Error extracting {zip_path}: {e}")
             continue
 
+        extracted.append(extract_dir)
+
+        if verbose:
+            print(f"  Extracted {file_count} file(s) to: {extract_dir}")
+            if skipped_count:
+                print(f"  Skipped {skipped_count} file(s) already extracted")
+
     return extracted
 
 
+def download_and_extract_zone_files(
+    zones: list[dict],
+    session: httpx.Client,
+    download_dir: Path,
+    verbose: bool = False
+) -> tuple[list[Path], list[Path]]:
+    """Download zone files and extract each one as soon as it arrives.
+
+    Extraction runs in worker processes while the remaining downloads are
+    still in flight, so network and CPU work overlap. Workers are started
+    with forkserver (or spawn) rather than fork, since forking while the
+    download threads hold client and stdio locks can deadlock. Extracted
+    files are moved into place in the order of ``zones``, so a member name
+    shared by several archives ends up with the content from the last one.
+
+    Args:
+        zones: List of dicts with 'zone_url' and 'zone_text' keys
+        session: Shared session from build_session
+        download_dir: Directory to save and extract downloaded files
+        verbose: Whether to print verbose output
+
+    Returns:
+        Tuple of (downloaded zip Paths, extracted directories)
+    """
+    jobs = {}
+
+    start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+    with ProcessPoolExecutor(mp_context=multiprocessing.get_context(start_method)) as executor:
+        def submit_extraction(zip_path: Path) -> None:
+            jobs[zip_path] = executor.submit(_extract_one, zip_path, download_dir)
+
+        downloaded_files = download_zone_files(
+            zones, session, download_dir, verbose=verbose, on_downloaded=submit_extraction
+        )
+        extracted = _collect_extractions(
+            [(zip_path, jobs[zip_path]) for zip_path in downloaded_files], download_dir, verbose
+        )
+
+    return downloaded_files, extracted
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Navigate to eminiplayer.net archive page using session cookies.'
@@ -595,6 +1084,12 @@ def main():
         action='store_true',
         help='Navigate to each "Keys" URL and list links containing "Trader Worksheet" in their text'
     )
+    parser.add_argument(
+        '--cache-dir',
+        type=Path,
+        default=None,
+        help='Cache fetched "Keys" pages in this directory and reuse them on later runs'
+    )
     parser.add_argument(
         '--start-date',
         type=str,
@@ -685,13 +1180,15 @@ def main():
         for name in cookies:
             print(f"  - {name}")
 
+    session = build_session(cookies)
+
     # Fetch the page
     if args.verbose:
         print(f"\nFetching: {args.url}")
 
     try:
-        response = fetch_archive_page(args.url, cookies)
-    except requests.RequestException as e:
+        response = fetch_archive_page(args.url, session)
+    except httpx.HTTPError as e:
         print(f"Error fetching page: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -707,7 +1204,10 @@ def main():
 
     # Handle --list-keys option
     if args.list_keys:
-        key_urls = extract_key_urls(response.text, args.url)
+        # Try the regex scan first; parse the page only if it finds nothing
+        key_urls = scan_key_urls(response.content, args.url, response.charset_encoding)
+        if not key_urls:
+            key_urls = extract_key_urls(response.content, args.url, response.charset_encoding)
         total_found = len(key_urls)
 
         # Apply date filtering if specified
@@ -735,7 +1235,7 @@ def main():
     # Handle --list-zones option
     if args.list_zones:
         # First, extract all Keys URLs from the archive page
-        key_urls = extract_key_urls(response.text, args.url)
+        key_urls = extract_key_urls(response.content, args.url, response.charset_encoding)
         total_keys = len(key_urls)
         if not key_urls:
             print("\nNo 'Keys' URLs found on the archive page.")
@@ -760,7 +1260,9 @@ def main():
             return
 
         # Navigate to each Keys URL and extract Zones links
-        zones = fetch_zones_from_keys(key_urls, cookies, verbose=args.verbose)
+        zones = fetch_zones_from_keys(
+            key_urls, session, verbose=args.verbose, cache_dir=args.cache_dir
+        )
 
         if zones:
             print(f"\n--- URLs with 'Zones' in anchor text ({len(zones)} found) ---")
@@ -775,19 +1277,21 @@ def main():
 
             # Handle download if specified
             if download_dir:
-                print(f"\n--- Downloading {len(zones)} zone file(s) to: {download_dir} ---")
-                downloaded_files = download_zone_files(
-                    zones, cookies, download_dir, verbose=args.verbose
-                )
-                print(f"\nSuccessfully downloaded {len(downloaded_files)} of {len(zones)} file(s)")
-
-                # Handle extract if specified
-                if args.extract and downloaded_files:
-                    print(f"\n--- Extracting {len(downloaded_files)} zip file(s) ---")
-                    extracted = extract_zip_files(
-                        downloaded_files, download_dir, verbose=args.verbose
+                # Handle extract if specified, unzipping while downloads continue
+                if args.extract:
+                    print(f"\n--- Downloading and extracting {len(zones)} zone file(s) to: {download_dir} ---")
+                    downloaded_files, extracted = download_and_extract_zone_files(
+                        zones, session, download_dir, verbose=args.verbose
+                    )
+                    print(f"\nSuccessfully downloaded {len(downloaded_files)} of {len(zones)} file(s)")
+                    if downloaded_files:
+                        print(f"\nSuccessfully extracted {len(extracted)} of {len(downloaded_files)} file(s)")
+                else:
+                    print(f"\n--- Downloading {len(zones)} zone file(s) to: {download_dir} ---")
+                    downloaded_files = download_zone_files(
+                        zones, session, download_dir, verbose=args.verbose
                     )
-                    print(f"\nSuccessfully extracted {len(extracted)} of {len(downloaded_files)} file(s)")
+                    print(f"\nSuccessfully downloaded {len(downloaded_files)} of {len(zones)} file(s)")
 
                 # Handle cleanup if specified
                 if args.cleanup and downloaded_files:
@@ -800,6 +1304,7 @@ def main():
                                 deleted_count += 1
                                 if args.verbose:
                                     print(f"  Deleted: {zip_file}")
+                            _sidecar_path(zip_file).unlink(missing_ok=True)
                         except OSError as e:
                             print(f"  Error deleting {zip_file}: {e}")
                     print(f"\nSuccessfully deleted {deleted_count} of {len(downloaded_files)} zip file(s)")
@@ -810,7 +1315,7 @@ def main():
     # Handle --es-worksheet option
     if args.es_worksheet:
         # First, extract all Keys URLs from the archive page
-        key_urls = extract_key_urls(response.text, args.url)
+        key_urls = extract_key_urls(response.content, args.url, response.charset_encoding)
         total_keys = len(key_urls)
         if not key_urls:
             print("\nNo 'Keys' URLs found on the archive page.")
@@ -835,7 +1340,9 @@ def main():
             return
 
         # Navigate to each Keys URL and extract Trader Worksheet links
-        worksheets = fetch_worksheets_from_keys(key_urls, cookies, verbose=args.verbose)
+        worksheets = fetch_worksheets_from_keys(
+            key_urls, session, verbose=args.verbose, cache_dir=args.cache_dir
+        )
 
         if worksheets:
             print(f"\n--- URLs with 'Trader Worksheet' in anchor text ({len(worksheets)} found) ---")
@@ -852,7 +1359,7 @@ def main():
             if download_dir:
                 print(f"\n--- Downloading {len(worksheets)} Trader Worksheet file(s) to: {download_dir} ---")
                 downloaded_files = download_worksheet_files(
-                    worksheets, cookies, download_dir, verbose=args.verbose
+                    worksheets, session, download_dir, verbose=args.verbose
                 )
                 print(f"\nSuccessfully downloaded {len(downloaded_files)} of {len(worksheets)} file(s)")
         else: